@@ -13,6 +13,9 @@ Architecture:
 The adapter pattern allows easy switching between storage backends and
 facilitates testing by providing a fast in-memory implementation.
 
+SQLModel/SQLAlchemy are only imported when a DatabaseAdapter is used, so
+importing this module stays cheap for memory-only code.
+
 Example:
     ```python
     # Memory storage for testing
@@ -25,12 +28,23 @@ Example:
     ```
 """
 
-from typing import TypeVar, Optional, List
+from typing import TYPE_CHECKING, Annotated, TypeVar, Optional, List, Dict, Iterator, Tuple
 from abc import abstractmethod, ABC
-from sqlmodel import SQLModel, Session, select
+from bisect import bisect_left, bisect_right, insort
+from .exceptions import DuplicateIdError
+
+if TYPE_CHECKING:
+    from sqlmodel import SQLModel, Session
 
 # Generic type variable bound to SQLModel for type safety across adapters
-T = TypeVar("T", bound=SQLModel)
+T = TypeVar("T", bound="SQLModel")
+
+# Maximum number of (skip, limit) pages MemoryAdapter keeps memoized
+_LIST_CACHE_SIZE = 32
+
+# IDs per SELECT when DatabaseAdapter reloads bulk-created rows, well below
+# the bound-parameter limit of any supported database
+_REFRESH_PAGE_SIZE = 1000
         
 
 class CRUDAdapter(ABC):
@@ -46,11 +60,26 @@ class CRUDAdapter(ABC):
         
     Attributes:
         model: The SQLModel class this adapter manages
+        _fields: Names of the model's fields and relationships, i.e. the keys
+            update() is allowed to assign
+        storage_name: Short backend identifier reported by CRUDBase.storage_type().
+            Defaults to the class name without the "Adapter" suffix, lowercased.
         
     Note:
         All methods are abstract and must be implemented by concrete adapters.
         This ensures a consistent interface across different storage backends.
+        Adapters declare __slots__, so instances carry no per-instance __dict__.
     """
+
+    __slots__ = ("model", "_fields", "__weakref__")
+
+    storage_name: str = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Derive the backend name once per class instead of on every call
+        if "storage_name" not in cls.__dict__:
+            cls.storage_name = cls.__name__.replace("Adapter", "").lower()
     
     def __init__(self, model_class: type[T]):
         """
@@ -60,14 +89,21 @@ class CRUDAdapter(ABC):
             model_class: The SQLModel class this adapter will manage
         """
         self.model = model_class 
+        # Precomputed once so update() filters keys with a set lookup
+        # instead of a hasattr() MRO walk per key
+        self._fields = frozenset(model_class.model_fields).union(
+            getattr(model_class, "__sqlmodel_relationships__", ())
+        )
     
     @abstractmethod
-    def create(self, data: dict) -> T:
+    def create(self, data: dict, *, validate: bool = True) -> T:
         """
         Create a new record with the provided data.
         
         Args:
             data: Dictionary containing the field values for the new record
+            validate: Run the model's validation. Pass False only for data
+                that has already been validated (e.g. by an API layer).
             
         Returns:
             The created model instance
@@ -77,6 +113,24 @@ class CRUDAdapter(ABC):
         """
         pass
     
+    @abstractmethod
+    def bulk_create(self, rows: List[dict], *, validate: bool = True) -> List[T]:
+        """
+        Create several records at once.
+        
+        Args:
+            rows: List of dictionaries, one per record to create
+            validate: Run the model's validation. Pass False only for data
+                that has already been validated (e.g. by an API layer).
+            
+        Returns:
+            The created model instances, in the same order as `rows`
+            
+        Raises:
+            Implementation-specific exceptions based on storage backend
+        """
+        pass
+    
     @abstractmethod
     def get(self, id: int) -> Optional[T]:
         """
@@ -146,7 +200,8 @@ class MemoryAdapter(CRUDAdapter):
     """
     In-memory storage adapter for CRUD operations.
     
-    This adapter stores all data in memory using Python lists. It's ideal for:
+    This adapter stores all data in memory using a dict keyed by record ID.
+    It's ideal for:
     - Unit testing (fast, isolated)
     - Caching scenarios
     - Development/prototyping
@@ -156,11 +211,16 @@ class MemoryAdapter(CRUDAdapter):
     - Automatic ID assignment for new records
     - Thread-safe for single-threaded usage
     - No persistence (data lost on restart)
-    - O(n) search complexity for most operations
+    - O(1) lookup by ID for get, update and delete
+    - ID-ordered listing, O(limit) per page via a sorted ID array
+    - Keyset pagination with list_after(), like DatabaseAdapter
+    - Memoized list() pages, invalidated when records are added or removed
     
     Attributes:
-        _data: Internal list storing all records
+        _data: Internal dict mapping record IDs to records
+        _ids: Sorted list of the stored IDs, maintained with bisect
         _counter: Auto-incrementing counter for ID assignment
+        _list_cache: Pages returned by list(), keyed by (skip, limit)
         
     Warning:
         This adapter is not thread-safe and data is not persistent.
@@ -174,6 +234,10 @@ class MemoryAdapter(CRUDAdapter):
         ```
     """
 
+    __slots__ = ("_data", "_ids", "_counter", "_list_cache")
+
+    storage_name = "memory"
+
     def __init__(self, model_class: type[T]):
         """
         Initialize the memory adapter.
@@ -182,26 +246,46 @@ class MemoryAdapter(CRUDAdapter):
             model_class: The SQLModel class this adapter will manage
         """
         super().__init__(model_class)
-        # Internal storage: list of model instances
-        self._data: List[T] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+        Drop every record and restart ID assignment at 1.
+        
+        Leaves the adapter as if freshly constructed, without redoing the
+        per-model setup in __init__.
+        """
+        # Internal storage: model instances indexed by ID
+        self._data: Dict[int, T] = {}
+        # Sorted IDs, kept separate from the records so that range lookups
+        # bisect over plain ints
+        self._ids: List[int] = []
         # Auto-incrementing counter for ID assignment
         self._counter: int = 1
+        # Memoized list() results; cleared whenever membership changes
+        self._list_cache: Dict[Tuple[int, int], List[T]] = {}
 
-    def create(self, data: dict) -> Optional[T]:
+    def create(self, data: dict, *, validate: bool = True) -> Optional[T]:
         """
         Create a new record in memory storage.
         
         Automatically assigns an ID if not provided using an internal counter.
-        The record is validated using the model's validation rules.
+        An explicitly provided ID is kept, and the counter moves past it.
+        The record is validated using the model's validation rules, unless
+        validate=False is passed for a non-table model, in which case it is
+        built with model_construct().
         
         Args:
             data: Dictionary containing the field values for the new record
+            validate: Run the model's validation. Pass False only for data
+                that has already been validated (e.g. by an API layer).
             
         Returns:
             The created and validated model instance
             
         Raises:
             ValidationError: If the data doesn't match the model schema
+            DuplicateIdError: If the provided ID is already in use
             
         Example:
             ```python
@@ -209,30 +293,132 @@ class MemoryAdapter(CRUDAdapter):
             print(f"Created user with ID: {user.id}")
             ```
         """
+        item = self._build(self._assign_id(data), validate)
+        self._data[item.id] = item
+        self._index_id(item.id)
+        self._list_cache.clear()
+        return item
 
-        if "id" in data and data["id"] is not None:
-            if (data["id"] > self._counter):
-                self._counter = data["id"] + 1
-            else: 
-                data["id"] = self._counter
-                self._counter += 1
+    def bulk_create(self, rows: List[dict], *, validate: bool = True) -> List[T]:
+        """
+        Create several records in memory storage at once.
+        
+        IDs are assigned exactly as in create(). All rows are validated
+        before any of them is stored, so a validation error leaves the
+        storage untouched.
+        
+        Args:
+            rows: List of dictionaries, one per record to create
+            validate: Run the model's validation. Pass False only for data
+                that has already been validated (e.g. by an API layer).
+            
+        Returns:
+            The created and validated model instances, in input order
+            
+        Raises:
+            ValidationError: If any row doesn't match the model schema
+            DuplicateIdError: If a provided ID is already in use or repeated
+            
+        Example:
+            ```python
+            users = adapter.bulk_create([
+                {"name": "Bob", "email": "bob@example.com"},
+                {"name": "Eve", "email": "eve@example.com"},
+            ])
+            ```
+        """
+        counter = self._counter
+        try:
+            items = [self._build(self._assign_id(row), validate) for row in rows]
+            batch = {item.id: item for item in items}
+            if len(batch) != len(items):
+                raise DuplicateIdError("bulk_create rows contain the same ID more than once")
+        except Exception:
+            # Give back the IDs the failed batch reserved
+            self._counter = counter
+            raise
+        self._data.update(batch)
+        self._ids.extend(batch)
+        self._ids.sort()  # Timsort merges the appended run in linear time
+        self._list_cache.clear()
+        return items
 
-        # Auto-assign ID if not provided
-        if "id" not in data or data["id"] is None:
-            data["id"] = self._counter
-            self._counter += 1
+    def _build(self, data: dict, validate: bool) -> T:
+        """
+        Instantiate the model from trusted or untrusted data.
+        
+        Table models always go through model_validate(): model_construct()
+        would skip SQLAlchemy's instrumentation, leaving an instance whose
+        attributes can't be assigned later by update().
+        
+        Args:
+            data: Dictionary containing the field values, including the ID
+            validate: Whether the data must be validated
+            
+        Returns:
+            The model instance
+        """
+        if validate or hasattr(self.model, "__table__"):
+            # Validate data using SQLModel validation
+            return self.model.model_validate(data)
+        return self.model.model_construct(**data)
 
-        # Validate data using SQLModel validation
-        item = self.model.model_validate(data)
-        self._data.append(item)
-        return item
+    def _index_id(self, id: int) -> None:
+        """
+        Insert an ID into the sorted ID array.
+        
+        Auto-assigned IDs always grow, so the common case is a plain append.
+        
+        Args:
+            id: The ID of a newly stored record
+        """
+        ids = self._ids
+        if not ids or id > ids[-1]:
+            ids.append(id)
+        else:
+            insort(ids, id)
+
+    def _unindex_id(self, id: int) -> None:
+        """
+        Remove an ID from the sorted ID array.
+        
+        Args:
+            id: The ID of a record that is being removed
+        """
+        del self._ids[bisect_left(self._ids, id)]
+
+    def _assign_id(self, data: dict) -> dict:
+        """
+        Fill in the ID of a new record using the internal counter.
+        
+        Args:
+            data: Dictionary containing the field values for the new record
+            
+        Returns:
+            A dictionary with its "id" key set. The caller's dictionary is
+            never modified.
+            
+        Raises:
+            DuplicateIdError: If the provided ID is already in use
+        """
+        incoming = data.get("id")
+        if incoming is None:
+            # Auto-assign ID if not provided
+            data = {**data, "id": self._counter}
+            self._counter += 1
+        elif incoming in self._data:
+            raise DuplicateIdError(f"A record with id {incoming} already exists")
+        else:
+            # Keep the caller's ID and make sure the counter never reuses it
+            self._counter = max(self._counter, incoming + 1)
+        return data
         
     def get(self, id: int) -> Optional[T]:
         """
         Retrieve a record by ID from memory storage.
         
-        Uses linear search through the internal list. Performance is O(n)
-        where n is the number of stored records.
+        Uses a direct dict lookup, so performance is O(1) regardless of
+        the number of stored records.
         
         Args:
             id: The unique identifier of the record to retrieve
@@ -247,13 +433,17 @@ class MemoryAdapter(CRUDAdapter):
                 print(f"Found: {user.name}")
             ```
         """
-        return next((item for item in self._data if item.id == id), None)
+        return self._data.get(id)
         
     def list(self, skip: int = 0, limit: int = 100) -> List[T]:
         """
         Retrieve a paginated list of records from memory.
         
-        Uses Python list slicing for efficient pagination.
+        Records are returned ordered by ID. Pagination slices the sorted ID
+        array, so a page costs O(limit), and the resulting page is memoized so
+        repeated calls with the same arguments only copy it. Updates modify
+        records in place, so cached pages stay valid until a record is
+        added or removed.
         
         Args:
             skip: Number of records to skip (for pagination)
@@ -271,15 +461,52 @@ class MemoryAdapter(CRUDAdapter):
             second_page = adapter.list(10, 10)
             ```
         """
-        return self._data[skip:skip + limit]
+        key = (skip, limit)
+        page = self._list_cache.get(key)
+        if page is None:
+            data = self._data
+            page = [data[id] for id in self._ids[skip:skip + limit]]
+            if len(self._list_cache) >= _LIST_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._list_cache[next(iter(self._list_cache))]
+            self._list_cache[key] = page
+        # Hand out a copy so callers can't corrupt the cached page
+        return list(page)
+
+    def list_after(self, after_id: int, limit: int = 100) -> List[T]:
+        """
+        Retrieve the records following a given ID (keyset pagination).
+        
+        Binary-searches the sorted ID array, so the cost of a page is
+        O(log n + limit) no matter how deep it is.
+        
+        Args:
+            after_id: ID of the last record of the previous page
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of model instances ordered by ID (may be empty)
+            
+        Example:
+            ```python
+            page = adapter.list_after(0, 10)
+            while page:
+                process(page)
+                page = adapter.list_after(page[-1].id, 10)
+            ```
+        """
+        start = bisect_right(self._ids, after_id)
+        data = self._data
+        return [data[id] for id in self._ids[start:start + limit]]
     
     def update(self, id: int, data: dict) -> Optional[T]:
         """
         Update an existing record in memory storage.
         
-        Finds the record by ID, merges the new data with existing data,
-        and replaces the record in the list. Preserves fields not specified
-        in the update data.
+        Finds the record by ID and assigns the new values in place. Only
+        the model's fields and relationships are updated, so unchanged fields
+        are preserved and the record is not re-validated as a whole. For
+        non-table models each assigned field is validated individually.
         
         Args:
             id: The unique identifier of the record to update
@@ -288,9 +515,17 @@ class MemoryAdapter(CRUDAdapter):
         Returns:
             The updated model instance if successful, None if record not found
             
+        Raises:
+            ValueError: If the record's ID would be set to None
+            DuplicateIdError: If the new ID is already in use
+            ValidationError: If the new ID is not valid for the model, or a
+                new value is invalid for a non-table model; in the latter
+                case fields assigned before the invalid one keep their new
+                values
+            
         Note:
-            Uses model_dump() if available (Pydantic v2), falls back to dict()
-            for backwards compatibility.
+            Mirrors DatabaseAdapter.update: unknown keys are ignored rather
+            than raising.
             
         Example:
             ```python
@@ -299,27 +534,74 @@ class MemoryAdapter(CRUDAdapter):
                 print(f"Updated: {updated_user.name}")
             ```
         """
-        for i, item in enumerate(self._data):
-            if item.id == id:
-                # Extract current data (handle both Pydantic v1 and v2)
-                item_data = item.model_dump() if hasattr(item, 'model_dump') else item.dict()
-                
-                # Merge with update data
-                item_data.update(data)
-                
-                # Create new validated instance
-                updated_item = self.model(**item_data)
-                
-                # Replace in storage
-                self._data[i] = updated_item
-                return updated_item
-        return None
+        item = self._data.get(id)
+        if item is None:
+            return None
+
+        # Check a new ID before touching the record, so a rejected update
+        # can't leave _data and _ids out of sync
+        if data.get("id", id) != id:
+            new_id = self._validate_id(data["id"])
+            if new_id is None:
+                raise ValueError("A record's id can't be set to None")
+            if new_id != id and new_id in self._data:
+                raise DuplicateIdError(f"A record with id {new_id} already exists")
+            # Assign the validated value, so the record matches its index key
+            data = {**data, "id": new_id}
+
+        # Table models are SQLAlchemy-instrumented and take plain setattr;
+        # other models validate each assigned field like create() does
+        if hasattr(self.model, "__table__"):
+            assign = setattr
+        else:
+            assign = self.model.__pydantic_validator__.validate_assignment
+
+        # Update only model fields and relationships
+        for key, value in data.items():
+            if key in self._fields:
+                assign(item, key, value)
+
+        # Keep the index consistent if the ID itself was changed
+        new_id = item.id
+        if new_id != id:
+            self._data[new_id] = self._data.pop(id)
+            self._unindex_id(id)
+            self._index_id(new_id)
+            # Auto-assigned IDs must never reuse the new one
+            self._counter = max(self._counter, new_id + 1)
+            self._list_cache.clear()
+        return item
+
+    def _validate_id(self, value):
+        """
+        Validate a new ID against the model's id field.
+        
+        Table models don't validate on assignment, so update() can't rely on
+        the record itself to turn e.g. "5" into 5 before it is re-indexed.
+        
+        Args:
+            value: The ID passed to update()
+            
+        Returns:
+            The ID as the model's id field would store it
+            
+        Raises:
+            ValidationError: If the value is not a valid ID for the model
+        """
+        from pydantic import TypeAdapter
+
+        field = self.model.model_fields["id"]
+        annotation = field.annotation
+        if field.metadata:
+            # Keep constraints such as Field(gt=0)
+            annotation = Annotated[(annotation, *field.metadata)]
+        return TypeAdapter(annotation).validate_python(value)
         
     def delete(self, id: int) -> bool:
         """
         Delete a record from memory storage.
         
-        Finds the record by ID and removes it from the internal list.
+        Removes the record by ID from the internal dict and ID array.
         
         Args:
             id: The unique identifier of the record to delete
@@ -328,7 +610,8 @@ class MemoryAdapter(CRUDAdapter):
             True if the record was found and deleted, False otherwise
             
         Note:
-            This operation is O(n) due to the need to find and remove from list.
+            Finding the record is O(1) and its slot in the sorted ID array
+            O(log n); removing that slot shifts the rest of the array.
             
         Example:
             ```python
@@ -338,11 +621,11 @@ class MemoryAdapter(CRUDAdapter):
                 print("User not found")
             ```
         """
-        item = self.get(id)
-        if item: 
-            self._data.remove(item)
-            return True
-        return False
+        if self._data.pop(id, None) is None:
+            return False
+        self._unindex_id(id)
+        self._list_cache.clear()
+        return True
     
     def count(self) -> int:
         """
@@ -376,10 +659,15 @@ class DatabaseAdapter(CRUDAdapter):
     
     Attributes:
         session: SQLModel session for database operations
+        autocommit: Whether each operation commits its own transaction
+        transaction_depth: Number of CRUDBase.transaction() blocks currently
+            open on this adapter
         
     Note:
         Requires an active database session and proper database setup.
-        All operations are immediately committed to the database.
+        By default all operations are immediately committed to the database.
+        With autocommit disabled, changes are only flushed and the caller is
+        responsible for committing (see CRUDBase.transaction()).
         
     Example:
         ```python
@@ -393,22 +681,123 @@ class DatabaseAdapter(CRUDAdapter):
         ```
     """
 
-    def __init__(self, model_class: type[T], session: Session):
+    __slots__ = (
+        "session",
+        "autocommit",
+        "transaction_depth",
+        "fast_get",
+        "_list_stmt",
+        "_list_after_stmt",
+        "_count_stmt",
+        "_has_server_defaults",
+    )
+
+    storage_name = "database"
+
+    def __init__(
+        self,
+        model_class: type[T],
+        session: "Session",
+        autocommit: bool = True,
+        fast_get: bool = False,
+    ):
         """
         Initialize the database adapter.
         
         Args:
             model_class: The SQLModel class this adapter will manage
             session: Active SQLModel session for database operations
+            autocommit: Commit after every write operation. When False,
+                writes are flushed only, so many operations can share a
+                single commit.
+            fast_get: Serve get() with a Core SELECT instead of the ORM,
+                returning instances that are not tracked by the session.
             
         Note:
             The session should be properly configured and connected to a database.
             The adapter assumes the session is ready for use.
         """
+        from sqlalchemy import bindparam
+        from sqlmodel import select, func
+
         super().__init__(model_class)
         self.session = session
+        self.autocommit = autocommit
+        self.transaction_depth = 0
+        self.fast_get = fast_get
+
+        # Statements are built once; pagination values are bound per call,
+        # so every call reuses the same SQLAlchemy compiled-cache entry
+        self._list_stmt = (
+            select(model_class).offset(bindparam("skip")).limit(bindparam("limit"))
+        )
+        self._list_after_stmt = None  # Built on first use; needs an id column
+        self._count_stmt = select(func.count()).select_from(model_class)
+
+        # Columns whose value the database may generate or change on write
+        self._has_server_defaults = any(
+            column.server_default is not None or column.server_onupdate is not None
+            for column in model_class.__table__.columns
+        )
+
+    def _commit(self) -> None:
+        """
+        Commit the pending changes, or just flush them if autocommit is off.
+        
+        Flushing still sends the SQL and populates database-generated values
+        such as auto-incremented IDs, but leaves the transaction open.
+        """
+        if self.autocommit:
+            self.session.commit()
+        else:
+            self.session.flush()
+
+    def _refresh(self, item: T) -> None:
+        """
+        Reload an instance after a write, but only when it could be stale.
+        
+        That is the case when the commit expired it (the session default),
+        or when the table has server-side defaults or ON UPDATE values.
+        Otherwise the in-memory instance already matches the row and the
+        extra SELECT is skipped.
+        
+        Args:
+            item: The instance that was just written
+        """
+        if self._may_be_stale():
+            self.session.refresh(item)
+
+    def _refresh_ids(self, ids: List[int]) -> None:
+        """
+        Reload several instances after a write, under the same rule as _refresh.
+        
+        Issues one SELECT per page of IDs rather than one per instance; the
+        loaded rows overwrite the instances already in the identity map.
+        
+        Args:
+            ids: IDs of the instances that were just written, read before
+                the commit could expire them
+        """
+        if not self._may_be_stale():
+            return
+
+        from sqlmodel import select
+
+        id_column = self.model.__table__.c.id
+        for start in range(0, len(ids), _REFRESH_PAGE_SIZE):
+            page = ids[start:start + _REFRESH_PAGE_SIZE]
+            statement = (
+                select(self.model)
+                .where(id_column.in_(page))
+                .execution_options(populate_existing=True)
+            )
+            self.session.exec(statement).all()
+
+    def _may_be_stale(self) -> bool:
+        """Whether just-written instances can differ from their rows."""
+        return self._has_server_defaults or (self.autocommit and self.session.expire_on_commit)
 
-    def create(self, data: dict) -> Optional[T]:
+    def create(self, data: dict, *, validate: bool = True) -> Optional[T]:
         """
         Create a new record in the database.
         
@@ -418,6 +807,9 @@ class DatabaseAdapter(CRUDAdapter):
         
         Args:
             data: Dictionary containing the field values for the new record
+            validate: Accepted for interface compatibility. SQLModel table
+                models are not validated by their constructor, so database
+                inserts never pay for a validation pass either way.
             
         Returns:
             The created model instance with database-generated values
@@ -434,9 +826,61 @@ class DatabaseAdapter(CRUDAdapter):
         """
         item = self.model(**data)
         self.session.add(item)
-        self.session.commit()
-        self.session.refresh(item)  # Get database-generated values
+        self._commit()
+        self._refresh(item)  # Get database-generated values
         return item
+
+    def bulk_create(self, rows: List[dict], *, validate: bool = True) -> List[T]:
+        """
+        Create several records in the database in a single transaction.
+        
+        Uses an ORM bulk INSERT ... RETURNING, which SQLAlchemy batches
+        into multi-row statements ("insertmanyvalues"), followed by one
+        commit (or flush when autocommit is off). Dialects without RETURNING
+        support fall back to add_all(), which is still flushed in one go.
+        
+        Args:
+            rows: List of dictionaries, one per record to create
+            validate: Accepted for interface compatibility; rows are passed
+                to the database without a Pydantic validation pass.
+            
+        Returns:
+            The created model instances, in input order
+            
+        Raises:
+            SQLAlchemyError: For database-related errors
+            
+        Note:
+            As with create(), the instances are reloaded after the commit
+            when it expired them, here with one SELECT per 1000 rows.
+            
+        Example:
+            ```python
+            users = adapter.bulk_create([
+                {"name": "Bob", "email": "bob@example.com"},
+                {"name": "Eve", "email": "eve@example.com"},
+            ])
+            ```
+        """
+        if not rows:
+            return []
+
+        from sqlmodel import insert
+
+        if self.session.get_bind().dialect.insert_returning:
+            statement = insert(self.model).returning(
+                self.model, sort_by_parameter_order=True
+            )
+            items = self.session.scalars(statement, rows).all()
+        else:
+            items = [self.model(**row) for row in rows]
+            self.session.add_all(items)
+            self.session.flush()
+
+        ids = [item.id for item in items]
+        self._commit()
+        self._refresh_ids(ids)  # Get database-generated values
+        return items
     
     def update(self, id: int, data: dict) -> Optional[T]:
         """
@@ -457,7 +901,7 @@ class DatabaseAdapter(CRUDAdapter):
             SQLAlchemyError: For database-related errors
             
         Note:
-            Only updates fields that exist as attributes on the model.
+            Only updates the model's fields and relationships.
             This prevents injection of invalid field names.
             
         Example:
@@ -467,16 +911,16 @@ class DatabaseAdapter(CRUDAdapter):
                 print(f"Updated: {updated_user.name}")
             ```
         """
-        item = self.get(id)
+        item = self.session.get(self.model, id)
         if item:
-            # Update only existing model attributes
+            # Update only model fields and relationships
             for key, value in data.items():
-                if hasattr(item, key):
+                if key in self._fields:
                     setattr(item, key, value)
             
             self.session.add(item)
-            self.session.commit()
-            self.session.refresh(item)  # Get any database updates
+            self._commit()
+            self._refresh(item)  # Get any database updates
             return item
         return None
 
@@ -487,12 +931,22 @@ class DatabaseAdapter(CRUDAdapter):
         Uses SQLAlchemy's efficient get method which utilizes the identity map
         for caching and primary key optimization.
         
+        When the adapter was created with fast_get=True, the row is instead
+        fetched with a Core SELECT on the session's connection and built
+        with model_construct(), skipping the identity map, ORM hydration and
+        validation (the data comes from the database, so it is trusted).
+        
         Args:
             id: The unique identifier of the record to retrieve
             
         Returns:
             The model instance if found, None otherwise
             
+        Warning:
+            Instances returned by the fast path are built without SQLAlchemy
+            instrumentation: they are not attached to the session and their
+            attributes can't be assigned. Use update() to modify records.
+            
         Example:
             ```python
             user = adapter.get(1)
@@ -500,7 +954,15 @@ class DatabaseAdapter(CRUDAdapter):
                 print(f"Found: {user.name}")
             ```
         """
-        return self.session.get(self.model, id)
+        if not self.fast_get:
+            return self.session.get(self.model, id)
+
+        table = self.model.__table__
+        statement = table.select().where(table.c.id == id)
+        row = self.session.connection().execute(statement).first()
+        if row is None:
+            return None
+        return self.model.model_construct(**row._mapping)
 
     def list(self, skip: int = 0, limit: int = 100) -> List[T]:
         """
@@ -516,6 +978,11 @@ class DatabaseAdapter(CRUDAdapter):
         Returns:
             List of model instances (may be empty)
             
+        Note:
+            The database still scans and discards the first `skip` rows, so
+            this is best suited for shallow pages. Use list_after() for deep
+            pagination and iter_all() for full scans.
+            
         Example:
             ```python
             # Get first 10 records
@@ -525,7 +992,67 @@ class DatabaseAdapter(CRUDAdapter):
             second_page = adapter.list(10, 10)
             ```
         """
-        return self.session.exec(select(self.model).offset(skip).limit(limit)).all()
+        params = {"skip": skip, "limit": limit}
+        return self.session.exec(self._list_stmt, params=params).all()
+
+    def list_after(self, after_id: int, limit: int = 100) -> List[T]:
+        """
+        Retrieve the records following a given ID (keyset pagination).
+        
+        Filters on the primary key instead of using OFFSET, so the cost of a
+        page depends only on `limit`, not on how deep the page is.
+        
+        Args:
+            after_id: ID of the last record of the previous page
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of model instances ordered by ID (may be empty)
+            
+        Example:
+            ```python
+            page = adapter.list_after(0, 10)
+            while page:
+                process(page)
+                page = adapter.list_after(page[-1].id, 10)
+            ```
+        """
+        if self._list_after_stmt is None:
+            from sqlalchemy import bindparam
+            from sqlmodel import select
+
+            self._list_after_stmt = (
+                select(self.model)
+                .where(self.model.id > bindparam("after_id"))
+                .order_by(self.model.id)
+                .limit(bindparam("limit"))
+            )
+        params = {"after_id": after_id, "limit": limit}
+        return self.session.exec(self._list_after_stmt, params=params).all()
+
+    def iter_all(self, batch: int = 1000) -> Iterator[T]:
+        """
+        Stream every record from the database in batches.
+        
+        Rows are fetched `batch` at a time using SQLAlchemy's yield_per, so
+        memory usage stays bounded regardless of table size.
+        
+        Args:
+            batch: Number of rows fetched from the database per round-trip
+            
+        Yields:
+            Model instances, one at a time
+            
+        Example:
+            ```python
+            for user in adapter.iter_all(batch=500):
+                export(user)
+            ```
+        """
+        from sqlmodel import select
+
+        statement = select(self.model).execution_options(yield_per=batch)
+        yield from self.session.exec(statement)
 
     def delete(self, id: int) -> bool:
         """
@@ -555,10 +1082,10 @@ class DatabaseAdapter(CRUDAdapter):
                 print("User not found")
             ```
         """
-        item = self.get(id)
+        item = self.session.get(self.model, id)
         if item:
             self.session.delete(item)
-            self.session.commit()
+            self._commit()
             return True
         return False
     
@@ -566,24 +1093,16 @@ class DatabaseAdapter(CRUDAdapter):
         """
         Get the total number of records in the database.
         
-        Executes a SELECT query to count all records of this model type.
+        Executes a single SELECT COUNT(*) query, so only one integer is
+        returned by the database and no model instances are loaded.
         
         Returns:
             The total count of records (integer >= 0)
             
-        Note:
-            This implementation loads all records to count them, which may
-            be inefficient for large datasets. Consider using a COUNT query
-            for better performance.
-            
-        TODO:
-            Optimize with: SELECT COUNT(*) FROM model_table
-            
         Example:
             ```python
             total = adapter.count()
             print(f"Total records: {total}")
             ```
         """
-        statement = select(self.model)
-        return len(list(self.session.exec(statement).all()))
+        return self.session.exec(self._count_stmt).one()
@@ -1,10 +1,52 @@
-from typing import TypeVar, Generic, get_args, get_origin, Optional, List, Literal
-from sqlmodel import SQLModel, Session
-from .adapters import DatabaseAdapter, MemoryAdapter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, TypeVar, Generic, get_args, get_origin, Optional, List, Dict, Literal, Iterator, Tuple
+from weakref import WeakKeyDictionary, WeakValueDictionary
+from .adapters import CRUDAdapter, DatabaseAdapter, MemoryAdapter
 from .exceptions import ModelTypeRequiredError
 
+if TYPE_CHECKING:
+    from sqlmodel import SQLModel, Session
+
 # Generic type variable bound to SQLModel for type safety
-T = TypeVar("T", bound=SQLModel)
+T = TypeVar("T", bound="SQLModel")
+
+# Resolved (origin, args) of each generic base, shared across subclasses.
+# typing caches aliases such as CRUDBase[User], so repeated definitions hit.
+_generic_base_cache: "WeakKeyDictionary[Any, Tuple[Any, Tuple[Any, ...]]]" = WeakKeyDictionary()
+
+
+def _resolve_generic_base(orig_base: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    """
+    Return the (origin, args) pair of a generic base, memoized per base.
+    
+    Args:
+        orig_base: An entry of a class's __orig_bases__
+    
+    Returns:
+        Tuple of typing.get_origin() and typing.get_args() for the base
+    """
+    try:
+        return _generic_base_cache[orig_base]
+    except (KeyError, TypeError):
+        resolved = (get_origin(orig_base), get_args(orig_base))
+        try:
+            _generic_base_cache[orig_base] = resolved
+        except TypeError:
+            # Not weak-referenceable or hashable; just skip caching
+            pass
+        return resolved
+
+
+# CRUDBase methods that are plain forwarders to the adapter method of the same name
+_FORWARDED_METHODS = ("create", "bulk_create", "get", "list", "update", "delete", "count")
+
+# Database adapters created with shared=True, kept alive only while some
+# CRUD instance still uses them (each one holds on to its session)
+_adapter_cache: "WeakValueDictionary[tuple, CRUDAdapter]" = WeakValueDictionary()
+
+# Memory adapters created with shared=True, one per model. Held strongly:
+# they are the storage, so their records must outlive any one CRUD instance
+_shared_memory_adapters: "Dict[type, MemoryAdapter]" = {}
 
 
 class CRUDMeta(type):
@@ -14,7 +56,9 @@ class CRUDMeta(type):
     
     This metaclass inspects the class inheritance chain to find the model type
     specified in the generic parameter (e.g., CRUDBase[User]) and assigns it
-    to the `model` class attribute.
+    to the `model` class attribute. The resolved model is also recorded as
+    `__zerocrud_model__`, so plain subclasses of an already-resolved CRUD
+    class skip the lookup entirely.
     
     Raises:
         ModelTypeRequiredError: If no model type is found in the generic parameters
@@ -27,22 +71,31 @@ class CRUDMeta(type):
         if name == "CRUDBase":
             return
 
+        # Subclass of an already-resolved CRUD class: model is inherited as-is
+        if (
+            "__orig_bases__" not in dct
+            and cls.model is not None
+            and cls.model is getattr(cls, "__zerocrud_model__", None)
+        ):
+            return
+
         # Look for generic type parameters in the class inheritance
         if hasattr(cls, "__orig_bases__"):
             for orig_base in cls.__orig_bases__:
-                origin = get_origin(orig_base)
+                origin, args = _resolve_generic_base(orig_base)
                 
                 # Check if this is inheriting from CRUDBase with generic parameters
-                if hasattr(origin, "__name__") and origin.__name__ == "CRUDBase":
-                    args = get_args(orig_base)
-                    if args:
-                        # Extract the first type argument as the model
-                        cls.model = args[0]
+                if hasattr(origin, "__name__") and origin.__name__ == "CRUDBase" and args:
+                    # Extract the first type argument as the model
+                    cls.model = args[0]
+                    break
                         
         # Ensure a model was found, otherwise raise an error
         if not cls.model:
             raise ModelTypeRequiredError("CRUDBase requires a model to function correctly.")
 
+        cls.__zerocrud_model__ = cls.model
+
 
 class CRUDBase(Generic[T], metaclass=CRUDMeta):
     """
@@ -59,6 +112,7 @@ class CRUDBase(Generic[T], metaclass=CRUDMeta):
     Attributes:
         model: The SQLModel class extracted from generic parameters
         adapter: The storage adapter instance handling actual operations
+        session: The database session, or None for memory storage
     
     Example:
         ```python
@@ -73,13 +127,16 @@ class CRUDBase(Generic[T], metaclass=CRUDMeta):
         ```
     """
     
+    __slots__ = ("_adapter", "session")
+
     # Will be set by metaclass based on generic parameter
     model: type[T] = None
 
     def __init__(
         self, 
-        session: Optional[Session] = None, 
+        session: Optional["Session"] = None, 
         storage: Optional[Literal["memory", "database"]] = None,
+        shared: bool = False,
         **kwargs
     ):
         """
@@ -88,7 +145,12 @@ class CRUDBase(Generic[T], metaclass=CRUDMeta):
         Args:
             session: SQLModel database session (required for database storage)
             storage: Storage backend type ("memory" or "database")
-            **kwargs: Additional arguments passed to adapter constructors
+            shared: Reuse one adapter across CRUD instances instead of
+                creating a new one. Memory storage is shared per model for the
+                rest of the process; database storage per session and options,
+                for as long as some CRUD instance still uses it
+            **kwargs: Additional arguments passed to the database adapter
+                constructor (e.g. autocommit=False)
         
         Raises:
             ValueError: If database storage is selected but no session is provided
@@ -96,31 +158,86 @@ class CRUDBase(Generic[T], metaclass=CRUDMeta):
         Note:
             - If no storage is specified but session is provided, defaults to database
             - If neither storage nor session is specified, defaults to memory
+            - With shared=True, memory storage is shared by every CRUD instance
+              of the same model, e.g. across FastAPI requests
         """
+        self.session = session
 
-        
         # Initialize the appropriate adapter based on storage type
         if storage == "memory":
-            self.adapter = MemoryAdapter(self.model)
+            adapter_class, adapter_kwargs = MemoryAdapter, {}
         elif storage == "database":
             if not session:
                 raise ValueError("Database backend requires a session")
-            self.adapter = DatabaseAdapter(self.model, session)
-            self.session = session
+            adapter_class, adapter_kwargs = DatabaseAdapter, {"session": session, **kwargs}
         elif session is not None:
             # Auto-detect database storage when session is provided
-            self.adapter = DatabaseAdapter(self.model, session)
-            self.session = session
+            adapter_class, adapter_kwargs = DatabaseAdapter, {"session": session, **kwargs}
         else: 
             # Default to memory storage
-            self.adapter = MemoryAdapter(self.model)
+            adapter_class, adapter_kwargs = MemoryAdapter, {}
+
+        if not shared:
+            self.adapter = adapter_class(self.model, **adapter_kwargs)
+        elif adapter_class is MemoryAdapter:
+            adapter = _shared_memory_adapters.get(self.model)
+            if adapter is None:
+                adapter = _shared_memory_adapters[self.model] = MemoryAdapter(self.model)
+            self.adapter = adapter
+        else:
+            # The adapter holds the session, so id(session) can't be reused
+            # while the cache entry is alive
+            options = tuple(sorted(
+                (name, value) for name, value in adapter_kwargs.items() if name != "session"
+            ))
+            key = (adapter_class, self.model, id(adapter_kwargs.get("session")), options)
+            adapter = _adapter_cache.get(key)
+            if adapter is None:
+                adapter = adapter_class(self.model, **adapter_kwargs)
+                _adapter_cache[key] = adapter
+            self.adapter = adapter
+
+    @property
+    def adapter(self) -> CRUDAdapter:
+        """The storage adapter handling the actual operations."""
+        return self._adapter
+
+    @adapter.setter
+    def adapter(self, adapter: CRUDAdapter) -> None:
+        self._adapter = adapter
+        self._bind_adapter_methods()
+
+    def _bind_adapter_methods(self) -> None:
+        """
+        Expose the adapter's bound methods directly on this instance.
+        
+        The CRUD methods below only forward to the adapter; storing the
+        adapter's bound methods as instance attributes lets calls skip that
+        extra Python frame. Methods overridden by a subclass are left alone,
+        as are fully slotted subclasses, which have no instance __dict__.
+        
+        Note:
+            Runs whenever `adapter` is assigned, so replacing the adapter
+            (e.g. with a test double) takes effect immediately.
+        """
+        namespace = getattr(self, "__dict__", None)
+        if namespace is None:
+            return
 
-    def create(self, data: dict) -> Optional[T]:
+        cls = type(self)
+        for name in _FORWARDED_METHODS:
+            # Never shadow a method the subclass customizes
+            if getattr(cls, name) is getattr(CRUDBase, name):
+                namespace[name] = getattr(self.adapter, name)
+
+    def create(self, data: dict, *, validate: bool = True) -> Optional[T]:
         """
         Create a new record with the provided data.
         
         Args:
             data: Dictionary containing the field values for the new record
+            validate: Run the model's validation. Pass False only for data
+                that has already been validated (e.g. by an API layer).
         
         Returns:
             The created model instance, or None if creation failed
@@ -130,7 +247,32 @@ class CRUDBase(Generic[T], metaclass=CRUDMeta):
             user = user_crud.create({"name": "Alice", "email": "alice@example.com"})
             ```
         """
-        return self.adapter.create(data)
+        return self.adapter.create(data, validate=validate)
+
+    def bulk_create(self, rows: List[dict], *, validate: bool = True) -> List[T]:
+        """
+        Create several records at once.
+        
+        Much faster than calling create() in a loop on database storage,
+        since all rows are inserted in one batch and committed once.
+        
+        Args:
+            rows: List of dictionaries, one per record to create
+            validate: Run the model's validation. Pass False only for data
+                that has already been validated (e.g. by an API layer).
+        
+        Returns:
+            The created model instances, in the same order as `rows`
+        
+        Example:
+            ```python
+            users = user_crud.bulk_create([
+                {"name": "Alice", "email": "alice@example.com"},
+                {"name": "Bob", "email": "bob@example.com"},
+            ])
+            ```
+        """
+        return self.adapter.bulk_create(rows, validate=validate)
         
     def get(self, id: int) -> Optional[T]:
         """
@@ -205,7 +347,7 @@ class CRUDBase(Generic[T], metaclass=CRUDMeta):
             print(f"Using {user_crud.storage_type()} storage")
             ```
         """
-        return type(self.adapter).__name__.replace("Adapter", "").lower()
+        return self.adapter.storage_name
     
     def update(self, id: int, data: dict) -> Optional[T]:
         """
@@ -241,3 +383,49 @@ class CRUDBase(Generic[T], metaclass=CRUDMeta):
             ```
         """
         return self.adapter.count()
+
+    @contextmanager
+    def transaction(self) -> Iterator["CRUDBase[T]"]:
+        """
+        Group several operations into a single database transaction.
+        
+        Inside the block the database adapter only flushes its changes;
+        they are committed once when the block exits, or rolled back if it
+        raises. This holds even when the CRUD was created with
+        autocommit=False. Nested blocks join the outermost transaction. With
+        memory storage this is a no-op and operations apply immediately.
+        
+        Yields:
+            This CRUD instance
+        
+        Example:
+            ```python
+            with user_crud.transaction():
+                for data in payloads:
+                    user_crud.create(data)
+            ```
+        """
+        adapter = self.adapter
+        if not isinstance(adapter, DatabaseAdapter):
+            # Memory storage applies every operation immediately
+            yield self
+            return
+
+        # Depth is kept on the adapter, which shared CRUD instances have in
+        # common; only the outermost block commits or rolls back
+        outermost = adapter.transaction_depth == 0
+        autocommit = adapter.autocommit
+        adapter.transaction_depth += 1
+        adapter.autocommit = False
+        try:
+            yield self
+        except BaseException:
+            if outermost:
+                self.session.rollback()
+            raise
+        else:
+            if outermost:
+                self.session.commit()
+        finally:
+            adapter.autocommit = autocommit
+            adapter.transaction_depth -= 1
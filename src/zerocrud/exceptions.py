@@ -16,3 +16,21 @@ class ModelTypeRequiredError(TypeError):
             pass
     ```
     """
+
+
+class DuplicateIdError(ValueError):
+    """
+    Raised when creating a record whose ID is already in use.
+    
+    The in-memory backend honors explicitly provided IDs, so it must
+    reject one that collides with an existing record (the database
+    backend reports the same situation as an IntegrityError).
+    
+    Example:
+    ```python
+        crud.create({"id": 1, "name": "Alice"})
+        
+        # This will raise DuplicateIdError
+        crud.create({"id": 1, "name": "Bob"})
+    ```
+    """
@@ -2,6 +2,8 @@
 Global pytest configuration and shared fixtures.
 """
 import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, create_engine, Session, Field
 from ..src.zerocrud.adapters import MemoryAdapter, DatabaseAdapter
 from ..src.zerocrud import CRUDBase
@@ -14,27 +16,73 @@ class User(SQLModel, table=True):
 class UserRepository(CRUDBase[User]): 
     pass
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_user_model():
+    """Validate one User up front so the first test doesn't pay for it."""
+    User.model_validate({"id": 0, "name": "x", "email": "x@x"}).model_dump()
+
 @pytest.fixture
 def sample_user_data():
     """Sample user data for testing."""
     return {"name": "Test User", "email": "test@example.com"}
 
-@pytest.fixture
-def db_session():
-    """Temporary database session for tests."""
-    engine = create_engine("sqlite:///:memory:")
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    In-memory database engine; the schema is created once per run.
+    
+    Each xdist worker is its own process and so gets its own database.
+    StaticPool keeps the one connection, and with it the database, alive
+    for the whole session regardless of which thread asks for it.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    
+    # pysqlite manages transactions itself and breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN so db_session can roll back each test
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
     SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db_session(db_engine):
+    """
+    Temporary database session for tests.
     
-    session = Session(engine)
+    Runs inside an outer transaction that is rolled back afterwards; the
+    session's own commits only release SAVEPOINTs, so every test starts
+    with empty tables without recreating the schema.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
-    engine.dispose()
+    transaction.rollback()
+    connection.close()
 
-@pytest.fixture
-def memory_adapter():
-    """MemoryAdapter configured for tests."""
+@pytest.fixture(scope="module")
+def _memory_adapter():
+    """MemoryAdapter built once per test module."""
     return MemoryAdapter(User)
 
+@pytest.fixture
+def memory_adapter(_memory_adapter):
+    """MemoryAdapter configured for tests, emptied before each test."""
+    _memory_adapter._reset()
+    return _memory_adapter
+
 @pytest.fixture  
 def db_adapter(db_session):
     """DatabaseAdapter configured for tests."""
@@ -1,10 +1,13 @@
 """
 Tests for CRUDBase and CRUDMeta.
 """
+import gc
+from unittest.mock import MagicMock
 import pytest
+from ..src.zerocrud import core
 from ..src.zerocrud.core import CRUDBase, CRUDMeta
 from ..src.zerocrud.exceptions import ModelTypeRequiredError
-from .conftest import User
+from .conftest import User, UserRepository
 
 class TestCRUDMeta:
     """Tests for CRUDMeta metaclass."""
@@ -21,38 +24,145 @@ class TestCRUDMeta:
         with pytest.raises(ModelTypeRequiredError):
             class BadCRUD(CRUDBase):
                 pass
+    
+    def test_subclass_inherits_resolved_model(self):
+        """Test that subclasses of a concrete CRUD class keep its model."""
+        class TestCRUD(CRUDBase[User]):
+            pass
+        
+        class ChildCRUD(TestCRUD):
+            pass
+        
+        assert ChildCRUD.model is User
+        assert ChildCRUD.__zerocrud_model__ is User
 
 class TestCRUDBase:
     """Tests for CRUDBase."""
     
-    def test_memory_storage_default(self):
-        """Test that memory is the default storage."""
-        class UserCRUD(CRUDBase[User]):
-            pass
+    @pytest.mark.parametrize("kwargs, expected", [
+        ({}, "memory"),
+        ({"storage": "memory"}, "memory"),
+        ({"session": "db"}, "database"),
+        ({"storage": "database"}, ValueError),
+    ], ids=["memory-default", "explicit-memory", "database-with-session", "database-requires-session"])
+    def test_storage_selection(self, request, kwargs, expected):
+        """Test that the storage backend is picked from storage and session."""
+        if kwargs.get("session") == "db":
+            # Only the database cases need a real session
+            kwargs = {**kwargs, "session": request.getfixturevalue("db_session")}
+        
+        if expected is ValueError:
+            with pytest.raises(ValueError, match="Database backend requires a session"):
+                UserRepository(**kwargs)
+            return
         
-        crud = UserCRUD()
-        assert crud.storage_type() == "memory"
+        crud = UserRepository(**kwargs)
+        assert crud.storage_type() == expected
+        assert crud.session is kwargs.get("session")
     
-    def test_database_storage_with_session(self, db_session):
-        """Test that uses database with session."""
-        class UserCRUD(CRUDBase[User]):
-            pass
+    def test_transaction_commits_once(self, db_session, sample_user_data):
+        """Test that operations inside transaction() are committed together."""
+        crud = UserRepository(session=db_session)
+        with crud.transaction():
+            user = crud.create(sample_user_data)
+            crud.update(user.id, {"name": "Renamed"})
+            assert db_session.in_transaction()
         
-        crud = UserCRUD(session=db_session)
-        assert crud.storage_type() == "database"
+        assert crud.adapter.autocommit is True
+        assert not db_session.in_transaction()
+        assert crud.get(user.id).name == "Renamed"
     
-    def test_explicit_memory_storage(self):
-        """Test explicit memory storage."""
-        class UserCRUD(CRUDBase[User]):
-            pass
+    def test_transaction_rolls_back_on_error(self, db_session, sample_user_data):
+        """Test that an exception inside transaction() discards the changes."""
+        crud = UserRepository(session=db_session)
+        with pytest.raises(RuntimeError):
+            with crud.transaction():
+                crud.create(sample_user_data)
+                raise RuntimeError("boom")
         
-        crud = UserCRUD(storage="memory")
-        assert crud.storage_type() == "memory"
+        assert crud.count() == 0
     
-    def test_explicit_database_storage_requires_session(self):
-        """Test that explicit database requires session."""
-        class UserCRUD(CRUDBase[User]):
-            pass
+    def test_transaction_commits_without_autocommit(self, db_session, sample_user_data):
+        """Test that transaction() commits on exit even with autocommit=False."""
+        crud = UserRepository(session=db_session, autocommit=False)
+        with crud.transaction():
+            crud.create(sample_user_data)
+        
+        assert crud.adapter.autocommit is False
+        assert not db_session.in_transaction()
+    
+    def test_nested_transaction_commits_once(self, db_session, sample_user_data):
+        """Test that only the outermost transaction() block commits."""
+        crud = UserRepository(session=db_session)
+        with crud.transaction():
+            with crud.transaction():
+                crud.create(sample_user_data)
+            assert db_session.in_transaction()
+            assert crud.adapter.transaction_depth == 1
+        
+        assert crud.adapter.transaction_depth == 0
+        assert not db_session.in_transaction()
+    
+    @pytest.fixture
+    def shared_memory(self, monkeypatch):
+        """Empty registry of shared memory adapters, restored afterwards."""
+        monkeypatch.setattr(core, "_shared_memory_adapters", {})
+    
+    def test_shared_memory_adapter(self, shared_memory):
+        """Test that shared=True reuses one memory adapter per model."""
+        first = UserRepository(shared=True)
+        second = UserRepository(shared=True)
+        isolated = UserRepository()
+        
+        first.create({"name": "Alice", "email": "alice@test.com"})
+        
+        assert second.adapter is first.adapter
+        assert second.count() == 1
+        assert isolated.count() == 0
+    
+    def test_shared_memory_outlives_instances(self, shared_memory):
+        """Test that shared memory data survives after its CRUD instance is gone."""
+        UserRepository(shared=True).create({"name": "Alice", "email": "alice@test.com"})
+        gc.collect()
+        
+        assert UserRepository(shared=True).count() == 1
+    
+    def test_shared_database_adapter(self, db_session):
+        """Test that shared=True reuses the adapter only for the same session."""
+        first = UserRepository(session=db_session, shared=True)
+        second = UserRepository(session=db_session, shared=True)
+        batched = UserRepository(session=db_session, shared=True, autocommit=False)
+        
+        assert second.adapter is first.adapter
+        assert batched.adapter is not first.adapter
+    
+    def test_adapter_methods_bound_on_instance(self):
+        """Test that forwarding methods are bound straight to the adapter."""
+        crud = UserRepository()
+        
+        assert crud.create == crud.adapter.create
+        assert crud.list == crud.adapter.list
+        assert crud.create({"name": "Alice", "email": "alice@test.com"}).id == 1
+        assert crud.count() == 1
+    
+    def test_replacing_adapter_rebinds_methods(self):
+        """Test that assigning a new adapter redirects the CRUD methods to it."""
+        crud = UserRepository()
+        original = crud.adapter
+        crud.adapter = MagicMock()
+        
+        crud.create({"name": "Alice", "email": "alice@test.com"})
+        
+        crud.adapter.create.assert_called_once()
+        assert original.count() == 0
+    
+    def test_overridden_methods_are_not_shadowed(self):
+        """Test that subclass overrides still run instead of the adapter method."""
+        class UpperCaseCRUD(CRUDBase[User]):
+            def create(self, data, **kwargs):
+                return super().create({**data, "name": data["name"].upper()}, **kwargs)
+        
+        crud = UpperCaseCRUD()
         
-        with pytest.raises(ValueError, match="Database backend requires a session"):
-            UserCRUD(storage="database")
\ No newline at end of file
+        assert crud.create({"name": "alice", "email": "alice@test.com"}).name == "ALICE"
+        assert crud.get == crud.adapter.get
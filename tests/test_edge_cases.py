@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from ..src.zerocrud import CRUDBase
 from ..src.zerocrud.exceptions import ModelTypeRequiredError
@@ -34,4 +38,16 @@ class TestEdgeCases:
         
         with pytest.raises(ModelTypeRequiredError):
             class SomeRepository(CRUDBase):
-                pass
\ No newline at end of file
+                pass
+
+    def test_import_does_not_load_sqlmodel(self):
+        """Test that importing zerocrud defers the SQLModel import"""
+        src = Path(__file__).resolve().parents[1] / "src"
+        code = "import sys, zerocrud; print('sqlmodel' in sys.modules)"
+        
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=src, capture_output=True, text=True, check=True,
+        )
+        
+        assert result.stdout.strip() == "False"
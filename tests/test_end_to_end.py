@@ -2,15 +2,11 @@
 End-to-end tests that verify complete workflows.
 """
 import pytest
-from ..src.zerocrud import CRUDBase
-from .conftest import User
+from .conftest import User, UserRepository
 
 def test_complete_crud_workflow_memory():
     """Test complete CRUD workflow with MemoryAdapter."""
-    class UserCRUD(CRUDBase[User]):
-        pass
-    
-    crud = UserCRUD(storage="memory")
+    crud = UserRepository(storage="memory")
     
     # Create
     user = crud.create({"name": "Alice", "email": "alice@test.com"})
@@ -1,22 +1,18 @@
 """
 Specific tests for MemoryAdapter.
-Inherits the base suite and adds implementation-specific tests.
+The shared behavior lives in test_adapters.py; these are implementation-specific tests.
 """
 import pytest
+from pydantic import ValidationError
 from .conftest import User
 from sqlmodel import SQLModel, Field
-from .test_adapters import AdapterTestSuite
 from ..src.zerocrud.adapters import MemoryAdapter
 from ..src.zerocrud import CRUDBase
+from ..src.zerocrud.exceptions import DuplicateIdError
 
-class TestMemoryAdapter(AdapterTestSuite):
+class TestMemoryAdapter:
     """Specific tests for MemoryAdapter."""
     
-    @pytest.fixture
-    def adapter(self, memory_adapter):
-        """Implements the fixture required by AdapterTestSuite."""
-        return memory_adapter
-    
     def test_memory_isolation(self):
         """Test that different instances are isolated."""
         adapter1 = MemoryAdapter(User)
@@ -27,36 +23,36 @@ class TestMemoryAdapter(AdapterTestSuite):
         assert adapter1.count() == 1
         assert adapter2.count() == 0  # Isolated
     
-    def test_id_auto_increment(self, adapter):
+    def test_id_auto_increment(self, memory_adapter):
         """Test that IDs auto-increment correctly."""
-        user1 = adapter.create({"name": "User1", "email": "user1@test.com"})
-        user2 = adapter.create({"name": "User2", "email": "user2@test.com"})
+        user1 = memory_adapter.create({"name": "User1", "email": "user1@test.com"})
+        user2 = memory_adapter.create({"name": "User2", "email": "user2@test.com"})
         
         assert user1.id == 1
         assert user2.id == 2
     
-    def test_id_counter_persists_after_delete(self, adapter):
+    def test_id_counter_persists_after_delete(self, memory_adapter):
         """Test that counter doesn't reset after deletion."""
-        user1 = adapter.create({"name": "User1", "email": "user1@test.com"})
-        adapter.delete(user1.id)
+        user1 = memory_adapter.create({"name": "User1", "email": "user1@test.com"})
+        memory_adapter.delete(user1.id)
         
-        user2 = adapter.create({"name": "User2", "email": "user2@test.com"})
+        user2 = memory_adapter.create({"name": "User2", "email": "user2@test.com"})
         
         # Counter continued forward
         assert user2.id == 2
     
-    def test_manual_id_assignment(self, adapter):
+    def test_manual_id_assignment(self, memory_adapter):
         """Test that ID can be assigned manually."""
-        user = adapter.create({"id": 100, "name": "User100", "email": "user100@test.com"})
+        user = memory_adapter.create({"id": 100, "name": "User100", "email": "user100@test.com"})
         
         assert user.id == 100
         
         # Counter adjusts
-        next_user = adapter.create({"name": "NextUser", "email": "next@test.com"})
+        next_user = memory_adapter.create({"name": "NextUser", "email": "next@test.com"})
         assert next_user.id == 101  # Counter continued from where it was
 
 
-    def test_id_none_defined(self, adapter):
+    def test_id_none_defined(self, memory_adapter):
         class Item(SQLModel):
             id: int = Field(default=None, primary_key=True)
             price:  float
@@ -70,4 +66,170 @@ class TestMemoryAdapter(AdapterTestSuite):
         fake_data_2 = {"price":5, "id":0}
 
         assert item_repo.create(fake_data).id == 1
-        assert item_repo.create(fake_data_2).id == 2
+        assert item_repo.create(fake_data_2).id == 0  # Explicit ID is honored
+        assert item_repo.create({"price": 1}).id == 2
+    
+    def test_create_without_validation(self):
+        """Test that validate=False builds non-table models without validating."""
+        class Item(SQLModel):
+            id: int = Field(default=None, primary_key=True)
+            price: float
+        
+        adapter = MemoryAdapter(Item)
+        item = adapter.create({"price": "not-a-number"}, validate=False)
+        
+        assert item.id == 1
+        assert item.price == "not-a-number"  # Trusted as-is
+        assert adapter.get(1) is item
+    
+    def test_update_validates_non_table_model(self):
+        """Test that update validates each assigned field of non-table models."""
+        class Item(SQLModel):
+            id: int = Field(default=None, primary_key=True)
+            price: float
+        
+        adapter = MemoryAdapter(Item)
+        adapter.create({"price": 1.5})
+        
+        assert adapter.update(1, {"price": "2.5"}).price == 2.5  # Coerced
+        with pytest.raises(ValidationError):
+            adapter.update(1, {"price": "not-a-number"})
+        assert adapter.get(1).price == 2.5
+    
+    def test_create_without_validation_table_model(self, memory_adapter, sample_user_data):
+        """Test that table models stay updatable when validate=False."""
+        user = memory_adapter.create(sample_user_data, validate=False)
+        
+        assert memory_adapter.update(user.id, {"name": "Updated"}).name == "Updated"
+    
+    def test_list_cache_invalidation(self, memory_adapter):
+        """Test that memoized list pages reflect creates, updates and deletes."""
+        user1 = memory_adapter.create({"name": "User1", "email": "user1@test.com"})
+        assert [u.id for u in memory_adapter.list()] == [user1.id]
+        
+        user2 = memory_adapter.create({"name": "User2", "email": "user2@test.com"})
+        assert [u.id for u in memory_adapter.list()] == [user1.id, user2.id]
+        
+        memory_adapter.update(user1.id, {"name": "Renamed"})
+        assert memory_adapter.list()[0].name == "Renamed"
+        
+        memory_adapter.delete(user1.id)
+        assert [u.id for u in memory_adapter.list()] == [user2.id]
+        
+        # Mutating a returned page must not affect later calls
+        memory_adapter.list().clear()
+        assert len(memory_adapter.list()) == 1
+    
+    def test_list_ordered_by_id(self, memory_adapter):
+        """Test that list and list_after return records sorted by ID."""
+        for id in (30, 10, 20):
+            memory_adapter.create({"id": id, "name": f"User{id}", "email": f"user{id}@test.com"})
+        
+        assert [u.id for u in memory_adapter.list()] == [10, 20, 30]
+        assert [u.id for u in memory_adapter.list(skip=1, limit=1)] == [20]
+        assert [u.id for u in memory_adapter.list_after(10, limit=5)] == [20, 30]
+        assert [u.id for u in memory_adapter.list_after(15, limit=1)] == [20]
+        
+        memory_adapter.delete(20)
+        memory_adapter.update(10, {"id": 40})
+        assert [u.id for u in memory_adapter.list()] == [30, 40]
+    
+    def test_update_to_existing_id_rejected(self, memory_adapter):
+        """Test that update refuses to move a record onto another record's ID."""
+        memory_adapter.create({"name": "User1", "email": "user1@test.com"})
+        memory_adapter.create({"name": "User2", "email": "user2@test.com"})
+        
+        with pytest.raises(DuplicateIdError):
+            memory_adapter.update(1, {"id": 2})
+        
+        assert memory_adapter.count() == 2
+        assert [u.id for u in memory_adapter.list()] == [1, 2]
+        assert memory_adapter.get(1).name == "User1"
+        assert memory_adapter.get(2).name == "User2"
+    
+    @pytest.mark.parametrize("table", [True, False], ids=["table", "non-table"])
+    def test_update_coerces_new_id(self, memory_adapter, table):
+        """Test that a new ID is validated before the record is re-indexed."""
+        if table:
+            adapter = memory_adapter
+            adapter.create({"name": "User1", "email": "user1@test.com"})
+        else:
+            class Item(SQLModel):
+                id: int = Field(default=None, primary_key=True)
+                price: float
+            
+            adapter = MemoryAdapter(Item)
+            adapter.create({"price": 1})
+        
+        item = adapter.update(1, {"id": "5"})
+        
+        assert item.id == 5
+        assert adapter.get(5) is item
+        assert adapter.get(1) is None
+        assert [i.id for i in adapter.list()] == [5]
+        assert adapter.create(dict(adapter.get(5).model_dump(), id=None)).id == 6
+        
+        with pytest.raises(ValidationError):
+            adapter.update(5, {"id": "not-an-id"})
+        assert adapter.get(5) is item
+    
+    def test_update_to_none_id_rejected(self, memory_adapter):
+        """Test that update refuses to clear a record's ID."""
+        memory_adapter.create({"name": "User1", "email": "user1@test.com"})
+        
+        with pytest.raises(ValueError):
+            memory_adapter.update(1, {"id": None})
+        
+        assert memory_adapter.get(1).id == 1
+        assert [u.id for u in memory_adapter.list()] == [1]
+    
+    def test_update_id_advances_counter(self, memory_adapter):
+        """Test that a record moved to a higher ID isn't collided with later."""
+        memory_adapter.create({"name": "User1", "email": "user1@test.com"})
+        memory_adapter.update(1, {"id": 5})
+        
+        assert memory_adapter.create({"name": "User2", "email": "user2@test.com"}).id == 6
+    
+    def test_duplicate_id_rejected(self, memory_adapter):
+        """Test that an explicit ID already in use raises DuplicateIdError."""
+        memory_adapter.create({"id": 5, "name": "User5", "email": "user5@test.com"})
+        
+        with pytest.raises(DuplicateIdError):
+            memory_adapter.create({"id": 5, "name": "Other", "email": "other@test.com"})
+        
+        with pytest.raises(DuplicateIdError):
+            memory_adapter.bulk_create([
+                {"id": 7, "name": "A", "email": "a@test.com"},
+                {"id": 7, "name": "B", "email": "b@test.com"},
+            ])
+        
+        assert memory_adapter.count() == 1
+    
+    def test_failed_bulk_create_keeps_counter(self, memory_adapter):
+        """Test that a rejected batch doesn't use up auto-assigned IDs."""
+        with pytest.raises(ValidationError):
+            memory_adapter.bulk_create([
+                {"name": "User1", "email": "user1@test.com"},
+                {"name": "User2"},  # Missing email
+            ])
+        
+        assert memory_adapter.count() == 0
+        assert memory_adapter.create({"name": "User3", "email": "user3@test.com"}).id == 1
+    
+    def test_create_does_not_mutate_input(self, memory_adapter, sample_user_data):
+        """Test that the auto-assigned ID is not written back into the input."""
+        memory_adapter.create(sample_user_data)
+        
+        assert "id" not in sample_user_data
+
+    
+    def test_reset_restores_initial_state(self, memory_adapter):
+        """Test that _reset() empties the adapter and restarts IDs at 1."""
+        memory_adapter.create({"name": "User1", "email": "user1@test.com"})
+        memory_adapter.list()
+        
+        memory_adapter._reset()
+        
+        assert memory_adapter.count() == 0
+        assert memory_adapter.list() == []
+        assert memory_adapter.create({"name": "User2", "email": "user2@test.com"}).id == 1